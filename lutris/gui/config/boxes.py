@@ -1,6 +1,5 @@
 """Widget generators and their signal handlers"""
 
-import os
 from abc import abstractmethod
 
 # Standard Library
@@ -18,18 +17,28 @@ from lutris.game import Game
 from lutris.gui.config.widget_generator import WidgetGenerator
 from lutris.gui.widgets.common import VBox
 from lutris.runners import InvalidRunnerError, import_runner
+from lutris.util.jobs import COMPLETED_IDLE_TASK, schedule_at_idle
 from lutris.util.log import logger
-from lutris.util.wine.wine import clear_wine_version_cache
+from lutris.util.wine.wine import clear_wine_version_cache_if_changed
 
 
 def set_option_wrapper_style_class(wrapper: Gtk.Widget, class_name: str | None):
-    """Sets a particular CSS class on a wrapper, and removes any other classes that start
-    with 'option-wrapper-' so there's only one o these classes."""
+    """Sets a particular CSS class on a wrapper, and removes the 'option-wrapper-' class
+    previously set, so there's only one o these classes. These classes are styled by
+    lutris.css, which is loaded once for the whole application.
+
+    The class last applied is remembered on the wrapper, so re-applying the same class
+    does not touch the style context at all, and replacing it needs no walk over the
+    wrapper's classes."""
+    previous_class_name = getattr(wrapper, "lutris_style_class", None)
+    if previous_class_name == class_name:
+        return
+
+    wrapper.lutris_style_class = class_name  # type:ignore[attr-defined]
     style_context = wrapper.get_style_context()
 
-    for cls in style_context.list_classes():
-        if cls.startswith("option-wrapper-") and cls != class_name:
-            style_context.remove_class(cls)
+    if previous_class_name:
+        style_context.remove_class(previous_class_name)
 
     if class_name:
         style_context.add_class(class_name)
@@ -49,8 +58,16 @@ class AdvancedSettingsBox(VBox):
     @advanced_visibility.setter
     def advanced_visibility(self, value):
         """Sets the visibility of every 'advanced' option and every section that
-        contains only 'advanced' options."""
+        contains only 'advanced' options. Setting the value it already has does nothing."""
+        if value == self._advanced_visibility:
+            return
+
         self._advanced_visibility = value
+        self.update_advanced_visibility()
+
+    def update_advanced_visibility(self) -> None:
+        """Called when advanced_visibility changes; by default this updates all
+        the widgets."""
         self.update_widgets()
 
     @abstractmethod
@@ -67,7 +84,7 @@ class ConfigBox(AdvancedSettingsBox):
 
     def __init__(self, config_level: str, lutris_config: LutrisConfig, game: Game | None = None, **kwargs) -> None:
         super().__init__(**kwargs)
-        self.options = []
+        self._options: list[dict[str, Any]] | None = None
         self.config_level = config_level
         self.lutris_config = lutris_config
         self.game = game
@@ -76,14 +93,32 @@ class ConfigBox(AdvancedSettingsBox):
         self.files = []
         self.files_list_store = None
         self._widget_generator = None
+        self._options_built = False
         self._filter = ""
         self._filter_text = ""
+        self._filter_task = COMPLETED_IDLE_TASK
 
         self.no_options_label = Gtk.Label(halign=Gtk.Align.CENTER, valign=Gtk.Align.CENTER)
         self.no_options_label.set_line_wrap(True)
         self.no_options_label.set_line_wrap_mode(Pango.WrapMode.WORD_CHAR)
         self.pack_end(self.no_options_label, True, True, 0)
 
+        # Option widgets are built only once the box is first shown, so tabs the user
+        # never opens never pay for them.
+        self.connect("map", self.on_map)
+
+    @property
+    def options(self) -> list[dict[str, Any]]:
+        """The option dicts this box displays; these are obtained by get_options()
+        when first needed, which is normally when the widgets are generated."""
+        if self._options is None:
+            self._options = self.get_options()
+        return self._options
+
+    def get_options(self) -> list[dict[str, Any]]:
+        """Returns the option dicts for this box; subclasses override this."""
+        return []
+
     @property
     def filter(self) -> str:
         return self._filter
@@ -91,10 +126,15 @@ class ConfigBox(AdvancedSettingsBox):
     @filter.setter
     def filter(self, value: str) -> None:
         """Sets the visibility of the options that have some text in the label or
-        help-text."""
+        help-text. The widgets are updated shortly afterwards, so that typing a search
+        updates them only once the user pauses. Setting the same filter again does nothing."""
+        if value == self._filter:
+            return
+
         self._filter = value
         self._filter_text = value.casefold()
-        self.update_widgets()
+        self._filter_task.unschedule()
+        self._filter_task = schedule_at_idle(self.refilter, delay_seconds=0.05)
 
     def generate_top_info_box(self, text):
         """Add a top section with general help text for the current tab"""
@@ -124,16 +164,6 @@ class ConfigBox(AdvancedSettingsBox):
             return self._widget_generator
 
         gen = ConfigWidgetGenerator(self)
-
-        if self.game and self.game.directory:
-            gen.default_directory = self.game.directory
-        elif self.game and self.game.has_runner and self.game.runner.has_working_dir:
-            gen.default_directory = self.game.runner.working_dir
-        elif self.lutris_config:
-            gen.default_directory = self.lutris_config.system_config.get("game_path") or os.path.expanduser("~")
-        else:
-            gen.default_directory = os.path.expanduser("~")
-
         self._widget_generator = gen
         return gen
 
@@ -141,24 +171,27 @@ class ConfigBox(AdvancedSettingsBox):
         """Called by the widget generate to filter option containers; return true for
         those that should be visible."""
         if not self.advanced_visibility:
-            is_advanced = hasattr(option_container, "lutris_advanced") and option_container.lutris_advanced
-            if is_advanced:
+            if option_container.lutris_advanced:  # type:ignore[attr-defined]
                 # Record that we hid this because it was advanced, not because of ordinary
                 # visibility
                 option_container.lutris_advanced_hidden = True  # type:ignore[attr-defined]
                 return False
 
         filter_text = self._filter_text
-        if filter_text and hasattr(option_container, "lutris_option_label"):
-            label = option_container.lutris_option_label.casefold()
-            helptext = option_container.lutris_option_helptext.casefold()  # type:ignore[attr-defined]
-            if filter_text not in label and filter_text not in helptext:
-                return False
+        if filter_text and filter_text not in option_container.lutris_search_text:  # type:ignore[attr-defined]
+            return False
 
         return True
 
+    def on_map(self, _widget: Gtk.Widget) -> None:
+        if not self._options_built:
+            self.generate_widgets()
+
     def generate_widgets(self):
-        """Parse the config dict and generates widget accordingly."""
+        """Parse the config dict and generates widget accordingly; this happens
+        when the box is first mapped, and only once."""
+        self._options_built = True
+
         # Select config section.
         if self.config_section == "game":
             self.config = self.lutris_config.game_config
@@ -192,6 +225,15 @@ class ConfigBox(AdvancedSettingsBox):
         if self._widget_generator:
             self._widget_generator.update_widgets()
 
+    def update_advanced_visibility(self) -> None:
+        # Advanced options are hidden by the filter, so only that needs re-applying.
+        self.refilter()
+
+    def refilter(self):
+        """Re-applies the filter to the option lists, without re-evaluating the options."""
+        if self._widget_generator:
+            self._widget_generator.refilter()
+
 
 class GameBox(ConfigBox):
     config_section = "game"
@@ -199,11 +241,12 @@ class GameBox(ConfigBox):
     def __init__(self, config_level: str, lutris_config: LutrisConfig, game: Game, **kwargs):
         ConfigBox.__init__(self, config_level, lutris_config, game, **kwargs)
         self.runner = game.runner
-        if self.runner:
-            self.options = self.runner.game_options
-        else:
+        if not self.runner:
             logger.warning("No runner in game supplied to GameBox")
 
+    def get_options(self) -> list[dict[str, Any]]:
+        return self.runner.game_options if self.runner else []
+
 
 class RunnerBox(ConfigBox):
     """Configuration box for runner specific options"""
@@ -217,18 +260,20 @@ class RunnerBox(ConfigBox):
             self.runner = import_runner(self.lutris_config.runner_slug)() if self.lutris_config.runner_slug else None
         except InvalidRunnerError:
             self.runner = None
-        if self.runner:
-            self.options = self.runner.get_runner_options()
 
         if lutris_config.level == "game":
             self.generate_top_info_box(
                 _("If modified, these options supersede the same options from the base runner configuration.")
             )
 
+    def get_options(self) -> list[dict[str, Any]]:
+        return self.runner.get_runner_options() if self.runner else []
+
     def generate_widgets(self):
         # Better safe than sorry - we search of Wine versions in directories
-        # we do not control, so let's keep up to date more aggresively.
-        clear_wine_version_cache()
+        # we do not control, so let's keep up to date more aggresively; but
+        # only rescan them if they have changed.
+        clear_wine_version_cache_if_changed()
         return super().generate_widgets()
 
 
@@ -240,11 +285,6 @@ class SystemConfigBox(ConfigBox):
         self.runner = None
         runner_slug = self.lutris_config.runner_slug
 
-        if runner_slug:
-            self.options = sysoptions.with_runner_overrides(runner_slug)
-        else:
-            self.options = sysoptions.system_options
-
         if lutris_config.game_config_id and runner_slug:
             self.generate_top_info_box(
                 _(
@@ -258,6 +298,12 @@ class SystemConfigBox(ConfigBox):
                 _("If modified, these options supersede the same options from the global preferences.")
             )
 
+    def get_options(self) -> list[dict[str, Any]]:
+        runner_slug = self.lutris_config.runner_slug
+        if runner_slug:
+            return sysoptions.with_runner_overrides(runner_slug)
+        return sysoptions.system_options
+
 
 class ConfigWidgetGenerator(WidgetGenerator):
     def __init__(self, parent: ConfigBox) -> None:
@@ -270,6 +316,20 @@ class ConfigWidgetGenerator(WidgetGenerator):
         self.raw_config = parent.raw_config
         self.lutris_config = parent.lutris_config
         self.reset_buttons: dict[str, Gtk.Button] = {}
+        self.reset_placeholders: dict[str, Gtk.Box] = {}
+
+    @property
+    def system_config(self) -> dict[str, Any]:
+        # The boxes of a dialog all share its LutrisConfig, which is already loaded.
+        return self.lutris_config.system_config
+
+    def resolve_default_directory(self) -> str:
+        game = self.parent.game
+        if game and game.directory:
+            return game.directory
+        if game and game.has_runner and game.runner.has_working_dir:
+            return game.runner.working_dir
+        return super().resolve_default_directory()
 
     def get_setting(self, option_key: str, default: Any) -> Any:
         if option_key in self.config:
@@ -298,36 +358,45 @@ class ConfigWidgetGenerator(WidgetGenerator):
         reset_container.set_margin_left(18)
         reset_container.pack_start(wrapper, True, True, 0)
 
-        reset_button = Gtk.Button.new_from_icon_name("edit-undo-symbolic", Gtk.IconSize.MENU)
-        reset_button.get_style_context().add_class("reset-button")
-        reset_button.set_valign(Gtk.Align.CENTER)
-        reset_button.set_halign(Gtk.Align.CENTER)
-        reset_button.set_margin_bottom(6)
-        reset_button.set_relief(Gtk.ReliefStyle.NONE)
-        reset_button.set_tooltip_text(_("Reset option to global or default config"))
-        reset_button.connect("clicked", self.on_reset_button_clicked, option)
-        self.reset_buttons[option_key] = reset_button
-
-        if option_key not in self.raw_config:
-            reset_button.set_visible(False)
-            reset_button.set_no_show_all(True)
-
-        placeholder = Gtk.Box()
+        # The placeholder reserves room for the reset button, which is only created
+        # once the option is actually set at this level.
+        placeholder = Gtk.Box(visible=True)
         placeholder.set_size_request(28, -1)
+        self.reset_placeholders[option_key] = placeholder
+
+        if option_key in self.raw_config:
+            self.show_reset_button(option_key)
 
-        placeholder.pack_start(reset_button, False, False, 0)
         reset_container.pack_end(placeholder, False, False, 5)
         return super().create_option_container(option, reset_container)
 
-    def get_visibility(self, option: dict[str, Any]) -> bool:
-        option_container = self.option_containers[option["option"]]
-        option_container.lutris_advanced_hidden = False  # type:ignore[attr-defined]
-        option_visibility = super().get_visibility(option)
+    def show_reset_button(self, option_key: str) -> None:
+        """Shows the reset button for an option, creating it if this is the first time."""
+        reset_button = self.reset_buttons.get(option_key)
+
+        if not reset_button:
+            reset_button = Gtk.Button.new_from_icon_name("edit-undo-symbolic", Gtk.IconSize.MENU)
+            reset_button.get_style_context().add_class("reset-button")
+            reset_button.set_valign(Gtk.Align.CENTER)
+            reset_button.set_halign(Gtk.Align.CENTER)
+            reset_button.set_margin_bottom(6)
+            reset_button.set_relief(Gtk.ReliefStyle.NONE)
+            reset_button.set_tooltip_text(_("Reset option to global or default config"))
+            reset_button.set_no_show_all(True)
+            reset_button.lutris_option_key = option_key  # type:ignore[attr-defined]
+            reset_button.connect("clicked", self.on_reset_button_clicked)
+            self.reset_placeholders[option_key].pack_start(reset_button, False, False, 0)
+            self.reset_buttons[option_key] = reset_button
 
-        if not option_visibility:
+        reset_button.show()
+
+    def is_option_container_shown(self, container: Gtk.Widget) -> bool:
+        container.lutris_advanced_hidden = False  # type:ignore[attr-defined]
+
+        if not super().is_option_container_shown(container):
             return False
 
-        return self.parent.filter_widget(option_container)
+        return self.parent.filter_widget(container)
 
     def get_tooltip(self, option: dict[str, Any], value: Any, default: Any):
         tooltip = super().get_tooltip(option, value, default)
@@ -337,14 +406,13 @@ class ConfigWidgetGenerator(WidgetGenerator):
             tooltip += _("<i>(Italic indicates that this option is modified in a lower configuration level.)</i>")
         return tooltip
 
-    def update_widgets(self):
-        super().update_widgets()
+    def refilter(self):
+        super().refilter()
 
         def get_no_options_message() -> str | None:
             if self.option_containers:
-                for container in self.option_containers.values():
-                    if container.get_visible():
-                        return None
+                if any(c.lutris_shown for c in self.option_containers.values()):  # type:ignore[attr-defined]
+                    return None
 
                 if self.parent.filter:
                     return _("No options match '%s'") % self.parent.filter
@@ -360,9 +428,11 @@ class ConfigWidgetGenerator(WidgetGenerator):
         else:
             self.parent.no_options_label.hide()
 
-    def on_reset_button_clicked(self, btn, option):
-        """Clear option (remove from config, reset option widget)."""
-        option_key = option["option"]
+    def on_reset_button_clicked(self, btn):
+        """Clear option (remove from config, reset option widget); the option is
+        identified by the key stored on the button."""
+        option_key = btn.lutris_option_key
+        option = self.options[option_key]
         wrapper = self.wrappers[option_key]
 
         btn.set_visible(False)
@@ -377,9 +447,8 @@ class ConfigWidgetGenerator(WidgetGenerator):
         """Common actions when value changed on a widget"""
         self.raw_config[option_key] = new_value
         self.config[option_key] = new_value
-        reset_btn = self.reset_buttons.get(option_key)
 
-        if reset_btn:
-            reset_btn.set_visible(True)
+        if option_key in self.reset_placeholders:
+            self.show_reset_button(option_key)
 
         super().on_changed(option_key, new_value)
@@ -56,7 +56,6 @@ class GameDialogCommon(SavableModelessDialog, DialogInstallUIDelegate):
         self.system_box: SystemConfigBox = None
         self.runner_name = None
         self.lutris_config: LutrisConfig = None
-        self.notebook_page_generators = {}
         self.notebook_page_updater = {}
 
         self.build_header_bar()
@@ -76,14 +75,11 @@ class GameDialogCommon(SavableModelessDialog, DialogInstallUIDelegate):
         self.vbox.pack_start(self.notebook, True, True, 0)
 
     def on_notebook_switch_page(self, notebook: Gtk.Notebook, page: Gtk.Widget, index: int) -> None:
-        generator = self.notebook_page_generators.get(index)
-        if generator:
-            generator()
-            del self.notebook_page_generators[index]
-        else:
-            updater = self.notebook_page_updater.get(index)
-            if updater:
-                updater()
+        # Config boxes generate their widgets when first mapped; before that,
+        # updating them does nothing.
+        updater = self.notebook_page_updater.get(index)
+        if updater:
+            updater()
 
         self.update_advanced_switch_visibility(index)
         self.update_search_entry_visibility(index)
@@ -222,11 +218,6 @@ class GameDialogCommon(SavableModelessDialog, DialogInstallUIDelegate):
 
         self.notebook_page_updater[page_index] = config_box.update_widgets
 
-        if page_index == 0:
-            config_box.generate_widgets()
-        else:
-            self.notebook_page_generators[page_index] = config_box.generate_widgets
-
         if advanced:
             self.option_page_indices.add(page_index)
         if searchable:
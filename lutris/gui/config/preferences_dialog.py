@@ -75,7 +75,6 @@ class PreferencesDialog(GameDialogCommon):
         self.stack.add_named(self.build_scrolled_window(storage_box), "storage-stack")
 
         self.system_box = SystemConfigBox(self.config_level, self.lutris_config, visible=True)
-        self.page_generators["system-stack"] = self.system_box.generate_widgets
         self.stack.add_named(self.build_scrolled_window(self.system_box), "system-stack")
 
     def on_sidebar_activated(self, _listbox, row):
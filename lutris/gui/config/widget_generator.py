@@ -49,8 +49,12 @@ class WidgetGenerator(ABC):
         self.changed = NotificationSource()  # takes option_key, new_value
         self.changed.register(self.on_changed, priority=1000)
         self._default_directory: str | None = None
-        self._current_parent: Gtk.Box | None = None
+        self._system_config: dict[str, Any] | None = None
+        self._current_parent: Gtk.ListBox | None = None
+        self._current_frame: SectionFrame | None = None
         self._current_section: str | None = None
+        self._tooltip_label: Label | None = None
+        self._tooltip_event_box: Gtk.EventBox | None = None
 
         # These are outputs set by generate_widget() or generate_container()
         # and they are reset on each call.
@@ -65,6 +69,7 @@ class WidgetGenerator(ABC):
         # These accumulate results across all widgets
         self.wrappers: dict[str, Gtk.Container] = {}
         self.section_frames: list[SectionFrame] = []
+        self.option_lists: list[Gtk.ListBox] = []
         self.option_containers: dict[str, Gtk.Container] = {}
 
         self._generators: dict[str, WidgetGenerator.GeneratorFunction] = {
@@ -90,60 +95,110 @@ class WidgetGenerator(ABC):
 
     @property
     def default_directory(self) -> str:
-        """This is the directory selected by default by file and directory choosers."""
+        """This is the directory selected by default by file and directory choosers; it
+        is resolved when first needed, and then remembered."""
         if not self._default_directory:
-            lutris_config = LutrisConfig()
-            self._default_directory = lutris_config.system_config.get("game_path") or os.path.expanduser("~")
+            self._default_directory = self.resolve_default_directory()
         return self._default_directory
 
     @default_directory.setter
     def default_directory(self, new_dir: str) -> None:
         self._default_directory = new_dir
 
+    def resolve_default_directory(self) -> str:
+        """Works out the default directory, if it has not been set; subclasses can
+        override this to pick a more specific directory."""
+        return self.system_config.get("game_path") or os.path.expanduser("~")
+
+    @property
+    def system_config(self) -> dict[str, Any]:
+        """The system configuration, used to find default paths; this is loaded from
+        disk when first needed. Subclasses that already have a LutrisConfig should
+        override this to use it instead."""
+        if self._system_config is None:
+            self._system_config = LutrisConfig().system_config
+        return self._system_config
+
     # Widget Construction
 
     def add_container(self, option: dict[str, Any], wrapper: Gtk.Box | None = None) -> Gtk.Widget | None:
         """Generates the option's widget, wrapper and container, and adds the container to the parent;
-        if the option uses 'section', then the container is actually placed inside a SectionFrame,
-        or in the previous frame if it is for the same section."""
+        the container goes in a row of an option list, which is placed in the parent. If the option
+        uses 'section', then the list is actually placed inside a SectionFrame; options continue in
+        the previous list if they are for the same section."""
         option_container = self.generate_container(option, wrapper)
 
         if option_container and self.parent:
-            # Switch to new section if required
-            if not self._current_parent:
-                self._current_parent = self.parent
-
-            if option.get("section") != self._current_section:
-                self._current_section = option.get("section")
-                if self._current_section:
-                    frame = SectionFrame(self._current_section, visible=True)
+            # Switch to a new list, in a new section if required
+            section = option.get("section")
+            if not self._current_parent or section != self._current_section:
+                self._current_section = section
+                option_list = self.create_option_list()
+                if section:
+                    frame = SectionFrame(section, visible=True)
+                    frame.add(option_list)
                     self.section_frames.append(frame)
-                    self._current_parent = frame.vbox
+                    self._current_frame = frame
                     self.parent.pack_start(frame, False, False, 0)
                 else:
-                    self._current_parent = self.parent
+                    self._current_frame = None
+                    self.parent.pack_start(option_list, False, False, 0)
+                self._current_parent = option_list
 
-            self._current_parent.pack_start(option_container, False, False, 0)
+            row = Gtk.ListBoxRow(visible=True, activatable=False, selectable=False, can_focus=False)
+            row.add(option_container)
+            row.lutris_option_container = option_container  # type:ignore[attr-defined]
+            self._current_parent.add(row)
+
+            if self._current_frame:
+                self._current_frame.option_containers.append(option_container)
         return option_container
 
+    def create_option_list(self) -> Gtk.ListBox:
+        """Creates a list to hold option containers; its rows are filtered by
+        is_option_container_shown()."""
+        option_list = Gtk.ListBox(visible=True, selection_mode=Gtk.SelectionMode.NONE)
+        option_list.get_style_context().add_class("option-list")
+        option_list.set_filter_func(self._filter_option_row)
+        self.option_lists.append(option_list)
+        return option_list
+
+    def _filter_option_row(self, row: Gtk.ListBoxRow) -> bool:
+        # The result is kept on the container, so that refilter() can use it
+        # without evaluating is_option_container_shown() again.
+        container = row.lutris_option_container  # type:ignore[attr-defined]
+        shown = self.is_option_container_shown(container)
+        container.lutris_shown = shown
+        return shown
+
     def generate_container(self, option: dict[str, Any], wrapper: Gtk.Box | None = None) -> Gtk.Widget | None:
         """Creates the widget, wrapper, and container; this returns the container
-        (or the wrapper if there's no container)."""
+        (or the wrapper if there's no container).
+
+        The wrapper and container are created visible, and the widget is shown as it
+        is generated, so the container needs no show_all(); update_widgets() then
+        hides just the containers that should not be seen."""
         option_widget = self.generate_widget(option, wrapper)
         if option_widget and self.wrapper:
             option_key = option["option"]
             option_container = self.create_option_container(option, self.wrapper)
             self.option_containers[option_key] = option_container
-            option_container.show_all()
 
             option_container.lutris_option_key = option_key  # type:ignore[attr-defined]
-            option_container.lutris_option_label = option["label"]  # type:ignore[attr-defined]
-            option_container.lutris_option_helptext = option.get("help") or ""  # type:ignore[attr-defined]
+            option_container.lutris_shown = False  # type:ignore[attr-defined]
+
+            # The text searched by filters, casefolded once here rather than on each search;
+            # the newline keeps a search from matching across the label and help-text.
+            search_text = option["label"] + "\n" + (option.get("help") or "")
+            option_container.lutris_search_text = search_text.casefold()  # type:ignore[attr-defined]
 
             # Mark advanced option containers, to be hidden by checking for this
             option_container.lutris_advanced = bool(option.get("advanced"))  # type:ignore[attr-defined]
             option_container.lutris_option = option  # type:ignore[attr-defined]
 
+            # Keep the message boxes too, so updates need not search the container's children
+            option_container.lutris_message_boxes = list(self.warning_messages)  # type:ignore[attr-defined]
+
             self.option_container = option_container
             return option_container
         else:
@@ -203,11 +258,14 @@ class WidgetGenerator(ABC):
         """Configures the wrapper box after it is created; this sets its tooltip, sensitivity, and
         creates warning message boxes."""
 
-        # Attach a tooltip to the wrapper
+        # Attach a tooltip to the wrapper; the markup is kept on the wrapper so a
+        # regenerated widget just replaces it, and the handler is connected only once.
         tooltip = self.get_tooltip(option, value, default)
-        if tooltip:
-            wrapper.props.has_tooltip = True
-            wrapper.connect("query-tooltip", self.on_query_tooltip, tooltip)
+        wrapper.lutris_tooltip_markup = tooltip  # type:ignore[attr-defined]
+        wrapper.props.has_tooltip = bool(tooltip)
+        if tooltip and not getattr(wrapper, "lutris_tooltip_connected", False):
+            wrapper.connect("query-tooltip", self.on_query_tooltip)
+            wrapper.lutris_tooltip_connected = True  # type:ignore[attr-defined]
 
     def get_tooltip(self, option: dict[str, Any], value: Any, default: Any):
         tooltip = option.get("help")
@@ -285,35 +343,57 @@ class WidgetGenerator(ABC):
         """Call this to update the visibility, sensitivity and other properties of
         the widgets, wrappers and containers already generated."""
 
+        # Option containers and section frames are kept in separate collections,
+        # so neither loop needs to check what kind of widget it has.
         for option_key, container in self.option_containers.items():
-            if hasattr(container, "lutris_option"):
-                option = container.lutris_option
-                wrapper = self.wrappers[option_key]
-                self.update_option_container(option, container, wrapper)
+            option = container.lutris_option  # type:ignore[attr-defined]
+            wrapper = self.wrappers[option_key]
+            self.update_option_container(option, container, wrapper)
+
+        self.refilter()
+
+    def refilter(self) -> None:
+        """Re-applies the filter to the rows of the option lists, and shows just the section frames
+        that still have options shown. This does not re-evaluate the options, so it is all that is
+        needed when only the filtering has changed.
+
+        The lists filter their rows immediately, and each container records whether it
+        was shown as 'lutris_shown', so the frames need not run the filter again."""
+        for option_list in self.option_lists:
+            option_list.invalidate_filter()
 
         for frame in self.section_frames:
-            visible = frame.has_visible_children()
-            frame.set_visible(visible)
-            frame.set_no_show_all(not visible)
+            visible = any(c.lutris_shown for c in frame.option_containers)  # type:ignore[attr-defined]
+            if visible != frame.get_visible():
+                frame.set_visible(visible)
+                frame.set_no_show_all(not visible)
+
+    def is_option_container_shown(self, container: Gtk.Widget) -> bool:
+        """Decides whether an option container is shown; if not, its row is filtered out of its
+        option list. By default this is just the container's visibility, as set by update_widgets(),
+        but subclasses can filter the options further."""
+        return container.get_visible()
 
     def update_option_container(self, option, container: Gtk.Container, wrapper: Gtk.Container):
         """This method updates an option container and its wrapper; this re-evaluates the
         relevant options in case they contain callables and those callables return different
         results."""
 
-        # Update messages in message boxes that support it
-        for child in container.get_children():
-            if hasattr(child, "update_message"):
-                child.update_message(option, self)
+        # Update messages in message boxes
+        for message_box in container.lutris_message_boxes:  # type:ignore[attr-defined]
+            message_box.update_message(option, self)
 
-        # Hide entire container if the option is not visible
+        # Hide entire container if the option is not visible; most updates change
+        # nothing, so only containers whose visibility flips are touched.
         visible = self.get_visibility(option)
-        container.set_visible(visible)
-        container.set_no_show_all(not visible)
+        if visible != container.get_visible():
+            container.set_visible(visible)
+            container.set_no_show_all(not visible)
 
         # Grey out option if condition unmet, or if a second setting is False
         condition: bool = self.get_condition(option)
-        wrapper.set_sensitive(condition)
+        if condition != wrapper.get_sensitive():
+            wrapper.set_sensitive(condition)
 
     # Widget factories
 
@@ -430,7 +510,10 @@ class WidgetGenerator(ABC):
                         choice_iterable = zip(choices, choices)
                     elif isinstance(choices[0], (list, tuple)) and len(choices[0]) == 2:
                         choice_iterable = choices
-            if not choice_iterable:
+                elif isinstance(choices, (Mapping, list, tuple)):
+                    # No choices at all, as with async choices that are still loading
+                    choice_iterable = []
+            if choice_iterable is None:
                 raise ValueError(
                     "Choice entries must be list of strings, list of tuple of strings or a dict of strings\n"
                     "Type is %s" % type(choices)
@@ -503,13 +586,16 @@ class WidgetGenerator(ABC):
 
         def get_invalidity_error(key: str):
             v = self.get_setting(key, self.get_default(option))
-            if v in valid_choices:
+            # With no choices (yet), there's nothing to say the setting is invalid
+            if not valid_choices or v in valid_choices:
                 return None
 
             return _("The setting '%s' is no longer available. You should select another choice.") % v
 
+        invalidity_box = None
         if not has_entry and value not in valid_choices:
-            self.warning_messages.append(ConfigWarningBox(get_invalidity_error))
+            invalidity_box = ConfigWarningBox(get_invalidity_error)
+            self.warning_messages.append(invalidity_box)
 
         # Async choices protocol: if the choices callable has a register_reload_callback attribute,
         # it supports background loading. The callable returns [] immediately when data isn't ready
@@ -518,7 +604,7 @@ class WidgetGenerator(ABC):
         if callable(choices_src) and hasattr(choices_src, "register_reload_callback"):
 
             def reload_choices():
-                nonlocal choices
+                nonlocal choices, valid_choices
                 choices = self.evaluate_option_value(choices_src, option=option)
                 liststore.clear()
                 populate_combobox_choices()
@@ -526,6 +612,10 @@ class WidgetGenerator(ABC):
                 # list; try again now that the choices are populated.
                 if value and not combobox.get_active_id():
                     combobox.set_active_id(value)
+                # The setting can only be found invalid now that there are choices to check it against
+                _expanded_choices, _tooltip_default, valid_choices = expand_combobox_choices()
+                if invalidity_box:
+                    invalidity_box.update_message(option, self)
 
             choices_src.register_reload_callback(reload_choices)
 
@@ -568,8 +658,7 @@ class WidgetGenerator(ABC):
             value = default
 
         if "default_path" in option:
-            lutris_config = LutrisConfig()
-            chooser_default_path = lutris_config.system_config.get(option["default_path"])
+            chooser_default_path = self.system_config.get(option["default_path"])
         else:
             chooser_default_path = self.default_directory
 
@@ -725,16 +814,22 @@ class WidgetGenerator(ABC):
         grid.connect("changed", on_changed)
         return self.build_option_widget(option, grid)
 
-    @staticmethod
-    def on_query_tooltip(_widget, _x, _y, _keybmode, tooltip, text):  # pylint: disable=unused-argument
-        """Prepare a custom tooltip with a fixed width"""
-        label = Label(text)
-        label.set_use_markup(True)
-        label.set_max_width_chars(60)
-        event_box = Gtk.EventBox()
-        event_box.add(label)
-        event_box.show_all()
-        tooltip.set_custom(event_box)
+    def on_query_tooltip(self, widget, _x, _y, _keybmode, tooltip):  # pylint: disable=unused-argument
+        """Prepare a custom tooltip with a fixed width; the label for it is created
+        once and reused for every wrapper's tooltip."""
+        text = getattr(widget, "lutris_tooltip_markup", None)
+        if not text:
+            return False
+
+        if not self._tooltip_label:
+            self._tooltip_label = Label()
+            self._tooltip_label.set_max_width_chars(60)
+            self._tooltip_event_box = Gtk.EventBox()
+            self._tooltip_event_box.add(self._tooltip_label)
+            self._tooltip_event_box.show_all()
+
+        self._tooltip_label.set_markup(text)
+        tooltip.set_custom(self._tooltip_event_box)
         return True
 
     # Option access
@@ -768,8 +863,8 @@ class WidgetGenerator(ABC):
 
         container = self.option_containers[option["option"]]
 
-        for child in container.get_children():
-            if hasattr(child, "blocks_sensitivity") and child.blocks_sensitivity:
+        for message_box in container.lutris_message_boxes:  # type:ignore[attr-defined]
+            if getattr(message_box, "blocks_sensitivity", False):
                 return False
 
         return condition
@@ -831,12 +926,11 @@ class SectionFrame(Gtk.Frame):
     def __init__(self, section, **kwargs):
         super().__init__(label=section, **kwargs)
         self.section = section
-        self.vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, visible=True)
-        self.add(self.vbox)
         self.get_style_context().add_class("section-frame")
 
-    def has_visible_children(self):
-        return any(w for w in self.vbox.get_children() if w.get_visible())
+        # The option containers in this frame's option list, recorded as they are added
+        # so checking them does not need to fetch the rows from GTK.
+        self.option_containers: list[Gtk.Widget] = []
 
 
 class WidgetWarningMessageBox(Gtk.Box):
@@ -858,19 +952,29 @@ class WidgetWarningMessageBox(Gtk.Box):
         self.label = Gtk.Label(visible=True, xalign=0)
         self.label.set_line_wrap(True)
         self.pack_start(self.label, False, False, 0)
+        self._markup: str | None = None
+        self._icon_name: str | None = icon_name
 
     def show_markup(self, markup, icon_name=None) -> bool:
         """Displays the markup given, and shows this box. If markup is empty or None,
         this hides the box instead. If icon_name is given, the box's icon is switched
-        to it. Returns the new visibility."""
+        to it. Returns the new visibility.
+
+        Most updates repeat the markup already shown, so this leaves the label and icon
+        alone unless they actually change; that avoids re-laying out the label."""
         visible = bool(markup)
 
         if markup:
-            self.label.set_markup(str(markup))
-            if icon_name:
+            markup = str(markup)
+            if markup != self._markup:
+                self.label.set_markup(markup)
+                self._markup = markup
+            if icon_name and icon_name != self._icon_name:
                 self.image.set_from_icon_name(icon_name, Gtk.IconSize.DND)
+                self._icon_name = icon_name
 
-        self.set_visible(visible)
+        if visible != self.get_visible():
+            self.set_visible(visible)
         return visible
 
 
@@ -884,6 +988,7 @@ class ConfigMessageBox(WidgetWarningMessageBox):
 
             if text:
                 self.label.set_markup(str(text))
+                self._markup = str(text)
 
     def update_message(self, option: dict[str, Any], generator: WidgetGenerator) -> bool:
         try:
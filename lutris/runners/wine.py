@@ -36,7 +36,7 @@ from lutris.runners.commands.wine import (  # noqa: F401 pylint: disable=unused-
     winetricks,
 )
 from lutris.runners.runner import RunDataDict, Runner
-from lutris.util import system
+from lutris.util import async_choices, system
 from lutris.util.display import DISPLAY_MANAGER, get_default_dpi, is_display_x11
 from lutris.util.graphics import drivers, vkquery
 from lutris.util.linux import LINUX_SYSTEM
@@ -244,7 +244,17 @@ def _get_wine_wayland_warning(_option_key: str, config: LutrisConfig) -> str | N
     return None
 
 
+@async_choices(
+    generate=get_installed_wine_versions,
+    ready=lambda: get_installed_wine_versions.is_cached,
+    error_message="Failed to list installed Wine versions",
+)
 def _get_wine_version_choices():
+    """Return (label, version) pairs for the installed Wine versions, for use as a choices callable.
+
+    Listing the versions reads several directories; if they are not cached yet, this lists them
+    in the background and returns [] immediately. The drop-down is repopulated once they are listed.
+    """
     version_choices = [(_("Custom (select executable below)"), "custom")]
     system_wine_labels = {
         "winehq-devel": _("WineHQ Devel ({})"),
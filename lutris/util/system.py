@@ -8,7 +8,7 @@ import stat
 import string
 import subprocess
 import zipfile
-from collections.abc import Callable, Iterable, Mapping, Sequence
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 from gettext import gettext as _
 from pathlib import Path
 from typing import IO
@@ -291,6 +291,15 @@ def find_executable(exec_name: str) -> str | None:
     return path
 
 
+def iter_executable_directories() -> Generator[str, None, None]:
+    """Iterate through the directories find_executable() searches; these are
+    the directories on the PATH, and then the Flatpak's /app/bin."""
+    for directory in os.environ.get("PATH", os.defpath).split(os.pathsep):
+        if directory:
+            yield directory
+    yield "/app/bin"
+
+
 def find_required_executable(exec_name: str) -> str:
     """Return the absolute path of an executable, but raises a
     MissingExecutableError if it could not be found."""
@@ -116,6 +116,17 @@ def get_umu_path() -> str:
     # line entry point.
     if system.can_find_executable("umu-run"):
         return system.find_required_executable("umu-run")
+    for umu_dir in _iter_umu_directories():
+        for entry_point in entry_points:
+            entry_path = os.path.join(umu_dir, entry_point)
+            if system.path_exists(entry_path):
+                return entry_path
+    raise MissingExecutableError("Install umu to use Proton")
+
+
+def _iter_umu_directories() -> Generator[str, None, None]:
+    """Iterate through the directories that may contain an umu installation, if it is
+    not on the PATH."""
     path_candidates = (
         "/app/share",  # prioritize flatpak due to non-rolling release distros
         "/usr/local/share",
@@ -124,11 +135,18 @@ def get_umu_path() -> str:
         settings.RUNTIME_DIR,
     )
     for path_candidate in path_candidates:
-        for entry_point in entry_points:
-            entry_path = os.path.join(path_candidate, "umu", entry_point)
-            if system.path_exists(entry_path):
-                return entry_path
-    raise MissingExecutableError("Install umu to use Proton")
+        yield os.path.join(path_candidate, "umu")
+
+
+def iter_umu_locations() -> Generator[str, None, None]:
+    """Iterate through all the directories get_umu_path() searches, including the
+    configured 'umu_path' and the directories on the PATH."""
+    custom_path = settings.read_setting("umu_path")
+    if custom_path:
+        yield custom_path
+
+    yield from system.iter_executable_directories()
+    yield from _iter_umu_directories()
 
 
 def get_proton_wine_path(version: str) -> str:
@@ -173,7 +191,7 @@ def get_proton_versions() -> dict[str, str]:
         return {}
 
     versions = dict()
-    for proton_path in _iter_proton_locations():
+    for proton_path in iter_proton_locations():
         if os.path.isdir(proton_path):
             for version in os.listdir(proton_path):
                 if version not in versions:
@@ -183,7 +201,7 @@ def get_proton_versions() -> dict[str, str]:
     return versions
 
 
-def _iter_proton_locations() -> Generator[str, None, None]:
+def iter_proton_locations() -> Generator[str, None, None]:
     """Iterate through all potential Proton locations"""
     yield settings.WINE_DIR
 
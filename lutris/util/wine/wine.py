@@ -178,6 +178,40 @@ def clear_wine_version_cache() -> None:
     proton.get_umu_path.cache_clear()
 
 
+# The directory modification times seen by the last call to
+# clear_wine_version_cache_if_changed(), or None before the first call.
+_wine_directory_mtimes: dict[str, int] | None = None
+
+
+def get_wine_directory_mtimes() -> dict[str, int]:
+    """Return the modification times, in nanoseconds, of the directories that are searched
+    for Wine versions and umu, keyed by path. Installing or removing a version changes one of
+    these; directories that do not exist are omitted."""
+    directories = [WINE_DIR]
+    directories.extend(os.path.dirname(path) for path in WINE_PATHS.values() if os.path.isabs(path))
+    directories.extend(proton.iter_proton_locations())
+    # This includes the PATH, where the system 'wine' is found too.
+    directories.extend(proton.iter_umu_locations())
+
+    mtimes = {}
+    for directory in directories:
+        try:
+            mtimes[directory] = os.stat(directory).st_mtime_ns
+        except OSError:
+            pass
+    return mtimes
+
+
+def clear_wine_version_cache_if_changed() -> None:
+    """Clears the Wine version cache, but only if the directories Wine versions are found in
+    have been modified since the last call; the first call always clears it."""
+    global _wine_directory_mtimes
+    mtimes = get_wine_directory_mtimes()
+    if mtimes != _wine_directory_mtimes:
+        clear_wine_version_cache()
+        _wine_directory_mtimes = mtimes
+
+
 def get_runner_files_dir_for_version(version: str) -> str | None:
     """This returns the path to the root of the Wine files for a specific version. The
     'bin' directory for that version is there, and we can place more directories there.
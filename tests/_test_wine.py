@@ -1,9 +1,12 @@
+import os
+import tempfile
 from types import SimpleNamespace
 from unittest import TestCase
 from unittest.mock import patch
 
 from lutris.runners import wine
 from lutris.util.test_config import setup_test_environment
+from lutris.util.wine import wine as wine_util
 from lutris.util.wine.dll_manager import DLLManager
 
 setup_test_environment()
@@ -37,3 +40,25 @@ class TestDxvkVersionWarning(TestCase):
             patch.object(wine.vkquery, "get_vulkan_api_version", return_value=None),
         ):
             self.assertIsNone(wine._get_dxvk_version_warning("dxvk_version", config))
+
+
+class TestWineVersionCache(TestCase):
+    @patch.object(wine_util, "_wine_directory_mtimes", None)
+    @patch.object(wine_util, "clear_wine_version_cache")
+    @patch.object(wine_util, "get_wine_directory_mtimes")
+    def test_cache_cleared_only_when_directories_change(self, get_mtimes, clear_cache):
+        get_mtimes.return_value = {"/wine": 1}
+        wine_util.clear_wine_version_cache_if_changed()
+        wine_util.clear_wine_version_cache_if_changed()
+        self.assertEqual(clear_cache.call_count, 1)
+
+        get_mtimes.return_value = {"/wine": 2}
+        wine_util.clear_wine_version_cache_if_changed()
+        self.assertEqual(clear_cache.call_count, 2)
+
+    def test_path_directories_are_watched(self):
+        # The system 'wine' and 'umu-run' are found on the PATH, so installing
+        # either must change the modification times seen.
+        with tempfile.TemporaryDirectory() as bin_dir:
+            with patch.dict(os.environ, {"PATH": bin_dir}):
+                self.assertIn(bin_dir, wine_util.get_wine_directory_mtimes())